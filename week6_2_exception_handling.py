@@ -3,10 +3,24 @@ Week 6.2: Exception Handling
 Concepts: try, except, finally, raise
 """
 
+import os
 import sys
 import traceback
 from typing import Optional
 
+# Fixed record keys shared by every history/audit entry below
+_K_EXPR = sys.intern('expression')
+_K_RES = sys.intern('result')
+_K_OK = sys.intern('success')
+_K_ERR = sys.intern('error')
+_K_BAL = sys.intern('balance_after')
+_K_TYPE = sys.intern('type')
+_K_AMT = sys.intern('amount')
+_K_FILE = sys.intern('file')
+_K_ENC = sys.intern('encoding')
+
+_SPECIAL = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
 print("="*60)
 print("WEEK 6.2: EXCEPTION HANDLING - TUTORIAL AND SOLUTIONS")
 print("="*60)
@@ -79,6 +93,9 @@ print("="*40)
 class RobustCalculator:
     """Calculator with comprehensive error handling"""
 
+    _ALLOWED_FUNCS = ('abs', 'round', 'min', 'max', 'sum', 'pow')
+    _ALLOWED_CHARS = frozenset(''.join(_ALLOWED_FUNCS))
+
     def __init__(self):
         self.history = []
         self.error_log = []
@@ -88,19 +105,19 @@ class RobustCalculator:
         try:
             allowed_names = {
                 k: v for k, v in vars(__builtins__).items()
-                if k in ['abs', 'round', 'min', 'max', 'sum', 'pow']
+                if k in self._ALLOWED_FUNCS
             }
 
             for char in expression:
-                if char.isalpha() and char not in str(allowed_names):
+                if char.isalpha() and char not in self._ALLOWED_CHARS:
                     raise ValueError(f"Invalid character: {char}")
 
             result = eval(expression, {"__builtins__": {}}, allowed_names)
 
             self.history.append({
-                'expression': expression,
-                'result': result,
-                'success': True
+                _K_EXPR: expression,
+                _K_RES: result,
+                _K_OK: True
             })
 
             return result
@@ -124,8 +141,8 @@ class RobustCalculator:
     def _log_error(self, error_msg, expression):
         """Log error for analysis"""
         self.error_log.append({
-            'expression': expression,
-            'error': error_msg
+            _K_EXPR: expression,
+            _K_ERR: error_msg
         })
 
     def safe_divide(self, a, b):
@@ -156,7 +173,7 @@ class RobustCalculator:
         if not self.history:
             return "No calculations performed yet"
 
-        successful = sum(1 for h in self.history if h.get('success'))
+        successful = sum(1 for h in self.history if h.get(_K_OK))
         total = len(self.history)
 
         return {
@@ -222,15 +239,24 @@ class RobustFileReader:
 
     def _try_read_primary(self, filepath):
         """Try to read file with encoding fallbacks"""
+        if not os.path.isfile(filepath):
+            self.read_attempts.append({
+                _K_FILE: filepath,
+                _K_ERR: 'File not found',
+                _K_OK: False
+            })
+            print(f"  File not found: {filepath}")
+            return None
+
         for encoding in self.encoding_fallbacks:
             try:
                 with open(filepath, 'r', encoding=encoding) as f:
                     content = f.read()
 
                 self.read_attempts.append({
-                    'file': filepath,
-                    'encoding': encoding,
-                    'success': True
+                    _K_FILE: filepath,
+                    _K_ENC: encoding,
+                    _K_OK: True
                 })
 
                 print(f"  Successfully read {filepath} with {encoding} encoding")
@@ -238,36 +264,36 @@ class RobustFileReader:
 
             except FileNotFoundError:
                 self.read_attempts.append({
-                    'file': filepath,
-                    'error': 'File not found',
-                    'success': False
+                    _K_FILE: filepath,
+                    _K_ERR: 'File not found',
+                    _K_OK: False
                 })
                 print(f"  File not found: {filepath}")
                 break
 
             except UnicodeDecodeError:
                 self.read_attempts.append({
-                    'file': filepath,
-                    'encoding': encoding,
-                    'error': 'Encoding error',
-                    'success': False
+                    _K_FILE: filepath,
+                    _K_ENC: encoding,
+                    _K_ERR: 'Encoding error',
+                    _K_OK: False
                 })
                 continue
 
             except PermissionError:
                 self.read_attempts.append({
-                    'file': filepath,
-                    'error': 'Permission denied',
-                    'success': False
+                    _K_FILE: filepath,
+                    _K_ERR: 'Permission denied',
+                    _K_OK: False
                 })
                 print(f"  Permission denied: {filepath}")
                 break
 
             except Exception as e:
                 self.read_attempts.append({
-                    'file': filepath,
-                    'error': str(e),
-                    'success': False
+                    _K_FILE: filepath,
+                    _K_ERR: str(e),
+                    _K_OK: False
                 })
                 print(f"  Unexpected error: {e}")
                 break
@@ -283,15 +309,15 @@ class RobustFileReader:
         """Read JSON file with error handling"""
         import json
 
+        if not os.path.isfile(filepath):
+            print(f"  JSON file not found: {filepath}")
+            return {}
+
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
             return data
 
-        except FileNotFoundError:
-            print(f"  JSON file not found: {filepath}")
-            return {}
-
         except json.JSONDecodeError as e:
             print(f"  Invalid JSON in {filepath}: {e}")
             return {}
@@ -394,8 +420,7 @@ class InputValidator:
             if not any(c.isdigit() for c in password):
                 errors.append("At least one number required")
 
-            special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-            if not any(c in special_chars for c in password):
+            if not any(c in _SPECIAL for c in password):
                 errors.append("At least one special character required")
 
             if errors:
@@ -442,9 +467,12 @@ class BankingError(Exception):
 class InsufficientFundsError(BankingError):
     """Raised when account has insufficient funds"""
     def __init__(self, balance, amount):
+        super().__init__(balance, amount)
         self.balance = balance
         self.amount = amount
-        super().__init__(f"Insufficient funds: balance ${balance:.2f}, requested ${amount:.2f}")
+
+    def __str__(self):
+        return f"Insufficient funds: balance ${self.balance:.2f}, requested ${self.amount:.2f}"
 
 class InvalidAccountError(BankingError):
     """Raised when account is invalid"""
@@ -453,9 +481,12 @@ class InvalidAccountError(BankingError):
 class TransactionLimitError(BankingError):
     """Raised when transaction exceeds limits"""
     def __init__(self, limit, amount):
+        super().__init__(limit, amount)
         self.limit = limit
         self.amount = amount
-        super().__init__(f"Transaction limit exceeded: limit ${limit:.2f}, requested ${amount:.2f}")
+
+    def __str__(self):
+        return f"Transaction limit exceeded: limit ${self.limit:.2f}, requested ${self.amount:.2f}"
 
 class AccountFrozenError(BankingError):
     """Raised when account is frozen"""
@@ -474,58 +505,49 @@ class SecureBankAccount:
 
     def withdraw(self, amount):
         """Withdraw money with comprehensive error checking"""
-        try:
-            if self.is_frozen:
-                raise AccountFrozenError(f"Account {self.account_number} is frozen")
-
-            if amount <= 0:
-                raise ValueError("Withdrawal amount must be positive")
+        if self.is_frozen:
+            self._log_transaction("withdrawal", amount, False)
+            raise AccountFrozenError(f"Account {self.account_number} is frozen")
 
-            if amount > self.balance:
-                raise InsufficientFundsError(self.balance, amount)
+        if amount <= 0:
+            self._log_transaction("withdrawal", amount, False)
+            raise ValueError("Withdrawal amount must be positive")
 
-            if self.daily_withdrawn + amount > self.daily_limit:
-                raise TransactionLimitError(
-                    self.daily_limit - self.daily_withdrawn,
-                    amount
-                )
+        if amount > self.balance:
+            self._log_transaction("withdrawal", amount, False)
+            raise InsufficientFundsError(self.balance, amount)
 
-            self.balance -= amount
-            self.daily_withdrawn += amount
-            self._log_transaction("withdrawal", amount, True)
+        if self.daily_withdrawn + amount > self.daily_limit:
+            self._log_transaction("withdrawal", amount, False)
+            raise TransactionLimitError(
+                self.daily_limit - self.daily_withdrawn,
+                amount
+            )
 
-            return f"Withdrawn ${amount:.2f}. New balance: ${self.balance:.2f}"
+        self.balance -= amount
+        self.daily_withdrawn += amount
+        self._log_transaction("withdrawal", amount, True)
 
-        except BankingError:
-            self._log_transaction("withdrawal", amount, False)
-            raise
-        except Exception as e:
-            self._log_transaction("withdrawal", amount, False)
-            raise BankingError(f"Unexpected error: {e}")
+        return f"Withdrawn ${amount:.2f}. New balance: ${self.balance:.2f}"
 
     def deposit(self, amount):
         """Deposit money with error checking"""
-        try:
-            if self.is_frozen:
-                raise AccountFrozenError(f"Account {self.account_number} is frozen")
-
-            if amount <= 0:
-                raise ValueError("Deposit amount must be positive")
+        if self.is_frozen:
+            self._log_transaction("deposit", amount, False)
+            raise AccountFrozenError(f"Account {self.account_number} is frozen")
 
-            if amount > 10000:
-                raise TransactionLimitError(10000, amount)
+        if amount <= 0:
+            self._log_transaction("deposit", amount, False)
+            raise ValueError("Deposit amount must be positive")
 
-            self.balance += amount
-            self._log_transaction("deposit", amount, True)
+        if amount > 10000:
+            self._log_transaction("deposit", amount, False)
+            raise TransactionLimitError(10000, amount)
 
-            return f"Deposited ${amount:.2f}. New balance: ${self.balance:.2f}"
+        self.balance += amount
+        self._log_transaction("deposit", amount, True)
 
-        except BankingError:
-            self._log_transaction("deposit", amount, False)
-            raise
-        except Exception as e:
-            self._log_transaction("deposit", amount, False)
-            raise BankingError(f"Unexpected error: {e}")
+        return f"Deposited ${amount:.2f}. New balance: ${self.balance:.2f}"
 
     def freeze_account(self):
         """Freeze the account"""
@@ -540,10 +562,10 @@ class SecureBankAccount:
     def _log_transaction(self, type, amount, success):
         """Log transaction for audit"""
         self.transaction_history.append({
-            'type': type,
-            'amount': amount,
-            'success': success,
-            'balance_after': self.balance if success else None
+            _K_TYPE: type,
+            _K_AMT: amount,
+            _K_OK: success,
+            _K_BAL: self.balance if success else None
         })
 
 account = SecureBankAccount("ACC123", 1000)
@@ -3,6 +3,11 @@ Week 6.3: Sets
 Concepts: Set operations, uniqueness
 """
 
+import heapq
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+
 print("="*60)
 print("WEEK 6.3: SETS - TUTORIAL AND SOLUTIONS")
 print("="*60)
@@ -62,13 +67,9 @@ def find_common_elements(*lists):
     if not lists:
         return set()
 
-    sets = [set(lst) for lst in lists]
-
-    common = sets[0]
-    for s in sets[1:]:
-        common = common.intersection(s)
+    sets = sorted((set(lst) for lst in lists), key=len)
 
-    return common
+    return sets[0].intersection(*sets[1:])
 
 def find_unique_elements(*lists):
     """Find elements unique to each list"""
@@ -76,35 +77,30 @@ def find_unique_elements(*lists):
         return []
 
     all_sets = [set(lst) for lst in lists]
-    unique_per_list = []
-
-    for i, current_set in enumerate(all_sets):
-        other_sets = all_sets[:i] + all_sets[i+1:]
-
-        union_of_others = set()
-        for other in other_sets:
-            union_of_others = union_of_others.union(other)
 
-        unique = current_set - union_of_others
-        unique_per_list.append(unique)
+    membership = Counter()
+    for s in all_sets:
+        membership.update(s)
 
-    return unique_per_list
+    return [{x for x in s if membership[x] == 1} for s in all_sets]
 
 def analyze_list_overlap(list1, list2):
     """Analyze overlap between two lists"""
     set1 = set(list1)
     set2 = set(list2)
+    common = set1 & set2
+    union_size = len(set1) + len(set2) - len(common)
 
     return {
         'list1_size': len(list1),
         'list2_size': len(list2),
         'unique_in_list1': len(set1),
         'unique_in_list2': len(set2),
-        'common': set1 & set2,
-        'only_in_list1': set1 - set2,
-        'only_in_list2': set2 - set1,
+        'common': common,
+        'only_in_list1': set1 - common,
+        'only_in_list2': set2 - common,
         'all_unique': set1 | set2,
-        'jaccard_similarity': len(set1 & set2) / len(set1 | set2) if set1 | set2 else 0
+        'jaccard_similarity': len(common) / union_size if union_size else 0
     }
 
 list1 = [1, 2, 3, 4, 5, 5]
@@ -147,27 +143,14 @@ def remove_duplicates_preserve_order(lst):
 
 def remove_duplicates_multiple_lists(*lists):
     """Remove duplicates across multiple lists"""
-    all_unique = set()
-    for lst in lists:
-        all_unique.update(lst)
-
-    return list(all_unique)
+    return list(set(chain.from_iterable(lists)))
 
 def find_duplicate_items(lst):
     """Find which items are duplicated"""
-    seen = set()
-    duplicates = set()
-
-    for item in lst:
-        if item in seen:
-            duplicates.add(item)
-        seen.add(item)
-
-    return duplicates
+    return {item for item, count in Counter(lst).items() if count > 1}
 
 def count_duplicates(lst):
     """Count occurrences of each duplicate"""
-    from collections import Counter
     counts = Counter(lst)
     return {item: count for item, count in counts.items() if count > 1}
 
@@ -192,37 +175,78 @@ class RecommendationSystem:
     def __init__(self):
         self.user_preferences = {}
         self.item_categories = {}
+        self._overlap_cache = {}
+        self._cached_pairs = {}
+        self._item_ids = {}
+        self._user_masks = {}
+        self._category_items = {}
 
     def add_user_preference(self, user, items):
         """Add user preferences"""
+        items = set(items)
         if user not in self.user_preferences:
             self.user_preferences[user] = set()
         self.user_preferences[user].update(items)
 
+        mask = self._user_masks.get(user, 0)
+        for item in items:
+            item_id = self._item_ids.setdefault(item, len(self._item_ids))
+            mask |= 1 << item_id
+        self._user_masks[user] = mask
+
+        for pair in self._cached_pairs.pop(user, ()):
+            del self._overlap_cache[pair]
+            for other_user in pair:
+                if other_user != user:
+                    self._cached_pairs[other_user].discard(pair)
+
+    def _overlap(self, user, other_user):
+        """Return cached (common, total) item counts for a pair of users"""
+        pair = frozenset((user, other_user))
+        overlap = self._overlap_cache.get(pair)
+        if overlap is None:
+            user_mask = self._user_masks[user]
+            other_mask = self._user_masks[other_user]
+            common = bin(user_mask & other_mask).count('1')
+            total = bin(user_mask | other_mask).count('1')
+            overlap = self._overlap_cache[pair] = (common, total)
+            for member in pair:
+                self._cached_pairs.setdefault(member, set()).add(pair)
+        return overlap
+
     def add_item_category(self, item, categories):
         """Add item to categories"""
         if item not in self.item_categories:
             self.item_categories[item] = set()
         self.item_categories[item].update(categories)
 
+        for category in self.item_categories[item]:
+            self._category_items.setdefault(category, set()).add(item)
+
+    def _iter_similarities(self, user):
+        """Yield (other_user, similarity, common) for every other user"""
+        for other_user in self.user_preferences:
+            if other_user != user:
+                common, total = self._overlap(user, other_user)
+                similarity = common / total if total > 0 else 0
+
+                yield other_user, similarity, common
+
     def find_similar_users(self, user):
         """Find users with similar preferences"""
         if user not in self.user_preferences:
             return []
 
-        user_prefs = self.user_preferences[user]
-        similarities = []
-
-        for other_user, other_prefs in self.user_preferences.items():
-            if other_user != user:
-                common = len(user_prefs & other_prefs)
-                total = len(user_prefs | other_prefs)
-                similarity = common / total if total > 0 else 0
+        similarities = list(self._iter_similarities(user))
+        similarities.sort(key=itemgetter(1), reverse=True)
+        return similarities
 
-                similarities.append((other_user, similarity, common))
+    def find_top_similar(self, user, k=3):
+        """Find the k users with the most similar preferences"""
+        if user not in self.user_preferences:
+            return []
 
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities
+        return heapq.nlargest(k, self._iter_similarities(user), key=itemgetter(1))
 
     def recommend_items(self, user, exclude_owned=True):
         """Recommend items based on similar users"""
@@ -232,9 +256,7 @@ class RecommendationSystem:
         user_items = self.user_preferences[user]
         recommendations = set()
 
-        similar_users = self.find_similar_users(user)
-
-        for similar_user, similarity, _ in similar_users[:3]:
+        for similar_user, similarity, _ in self.find_top_similar(user, 3):
             other_items = self.user_preferences[similar_user]
             new_items = other_items - user_items if exclude_owned else other_items
             recommendations.update(new_items)
@@ -253,13 +275,11 @@ class RecommendationSystem:
             if item in self.item_categories:
                 user_categories.update(self.item_categories[item])
 
-        recommendations = set()
-        for item, categories in self.item_categories.items():
-            if item not in user_items:
-                if categories & user_categories:
-                    recommendations.add(item)
+        candidates = set().union(
+            *(self._category_items[c] for c in user_categories)
+        )
 
-        return list(recommendations)
+        return list(candidates - user_items)
 
 recommender = RecommendationSystem()
 
@@ -305,15 +325,15 @@ class VennDiagramCalculator:
 
     def two_set_venn(self):
         """Calculate regions for two-set Venn diagram"""
-        only_a = self.set_a - self.set_b
-        only_b = self.set_b - self.set_a
         both = self.set_a & self.set_b
+        only_a = self.set_a - both
+        only_b = self.set_b - both
 
         return {
             'only_A': only_a,
             'only_B': only_b,
             'A_and_B': both,
-            'total_unique': len(self.set_a | self.set_b)
+            'total_unique': len(self.set_a) + len(self.set_b) - len(both)
         }
 
     def three_set_venn(self):
@@ -321,15 +341,23 @@ class VennDiagramCalculator:
         if not self.set_c:
             return None
 
-        only_a = self.set_a - self.set_b - self.set_c
-        only_b = self.set_b - self.set_a - self.set_c
-        only_c = self.set_c - self.set_a - self.set_b
+        set_a, set_b, set_c = self.set_a, self.set_b, self.set_c
+
+        ab = set_a & set_b
+        ac = set_a & set_c
+        bc = set_b & set_c
+        all_three = ab & set_c
 
-        a_and_b = (self.set_a & self.set_b) - self.set_c
-        a_and_c = (self.set_a & self.set_c) - self.set_b
-        b_and_c = (self.set_b & self.set_c) - self.set_a
+        only_a = set_a - ab - ac
+        only_b = set_b - ab - bc
+        only_c = set_c - ac - bc
 
-        all_three = self.set_a & self.set_b & self.set_c
+        a_and_b = ab - all_three
+        a_and_c = ac - all_three
+        b_and_c = bc - all_three
+
+        total_unique = (len(set_a) + len(set_b) + len(set_c)
+                        - len(ab) - len(ac) - len(bc) + len(all_three))
 
         return {
             'only_A': only_a,
@@ -339,7 +367,7 @@ class VennDiagramCalculator:
             'A_and_C_only': a_and_c,
             'B_and_C_only': b_and_c,
             'A_and_B_and_C': all_three,
-            'total_unique': len(self.set_a | self.set_b | self.set_c)
+            'total_unique': total_unique
         }
 
     def visualize_two_sets(self):
@@ -376,21 +404,80 @@ print("ADVANCED SET OPERATIONS")
 print("="*40)
 
 def powerset(s):
+    """Lazily generate every subset of s as a tuple"""
+    s = tuple(s)
+    n = len(s)
+
+    for mask in range(1 << n):
+        yield tuple(s[i] for i in range(n) if (mask >> i) & 1)
+
+def powerset_sets(s):
     """Generate power set of a set"""
-    s = list(s)
-    power = [[]]
+    return [set(subset) for subset in powerset(s)]
+
+def _subset_sum_search(numbers, target):
+    """Branch-and-bound search for a subset of non-negative numbers"""
+    numbers = sorted(numbers, reverse=True)
+    n = len(numbers)
 
-    for elem in s:
-        power.extend([subset + [elem] for subset in power])
+    suffix = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + numbers[i]
+
+    def search(i, remaining, chosen):
+        if remaining == 0:
+            return chosen
+        if i == n or remaining < 0 or suffix[i] < remaining:
+            return None
+        found = search(i + 1, remaining - numbers[i], chosen + [numbers[i]])
+        if found is not None:
+            return found
+        return search(i + 1, remaining, chosen)
 
-    return [set(subset) for subset in power]
+    return search(0, target, [])
 
 def is_subset_sum(numbers, target):
     """Check if any subset sums to target"""
-    for subset in powerset(numbers):
-        if sum(subset) == target:
-            return True, subset
-    return False, None
+    numbers = list(numbers)
+
+    if any(x < 0 for x in numbers):
+        for subset in powerset(numbers):
+            if sum(subset) == target:
+                return True, set(subset)
+        return False, None
+
+    # The bitset needs target + 1 bits per snapshot, so with only a few
+    # numbers next to a huge target it is cheaper to search the subsets
+    if (not isinstance(target, int) or not all(isinstance(x, int) for x in numbers)
+            or 1 << len(numbers) < target):
+        found = _subset_sum_search(numbers, target)
+        return (True, set(found)) if found is not None else (False, None)
+
+    if target < 0:
+        return False, None
+
+    # Bit k of reachable is set when some subset of the numbers seen so far
+    # sums to k; sums above target are masked off, and numbers larger than
+    # target leave the snapshot unchanged so backtracking never picks them
+    mask = (1 << (target + 1)) - 1
+    reachable = 1
+    snapshots = [reachable]
+    for x in numbers:
+        if x <= target:
+            reachable = (reachable | reachable << x) & mask
+        snapshots.append(reachable)
+
+    if not (reachable >> target) & 1:
+        return False, None
+
+    subset = set()
+    remaining = target
+    for i in range(len(numbers) - 1, -1, -1):
+        if not (snapshots[i] >> remaining) & 1:
+            subset.add(numbers[i])
+            remaining -= numbers[i]
+
+    return True, subset
 
 def set_partition(s, n):
     """Check if set can be partitioned into n equal sum subsets"""
@@ -403,7 +490,7 @@ def set_partition(s, n):
 
 sample_set = {1, 2, 3}
 print(f"Set: {sample_set}")
-print(f"Power set: {powerset(sample_set)}")
+print(f"Power set: {powerset_sets(sample_set)}")
 
 numbers = {1, 3, 5, 7, 9}
 target = 12
@@ -3,7 +3,7 @@ Week 7: Functional Programming
 Concepts: List comprehensions, lambda functions, map/filter/reduce
 """
 
-from functools import reduce
+from functools import lru_cache, reduce
 import operator
 
 print("="*60)
@@ -47,7 +47,7 @@ matrix = [
     [7, 8, 9]
 ]
 
-transpose = [[row[i] for row in matrix] for i in range(len(matrix[0]))]
+transpose = [list(col) for col in zip(*matrix)]
 
 print("Original matrix:")
 for row in matrix:
@@ -61,9 +61,17 @@ print("\nPRACTICE PROBLEM 3: Generate Primes with Comprehension")
 print("-" * 40)
 
 def primes_comprehension(limit):
-    """Generate primes using list comprehension"""
-    return [n for n in range(2, limit + 1)
-            if all(n % i != 0 for i in range(2, int(n**0.5) + 1))]
+    """Generate primes using a sieve and list comprehension"""
+    if limit < 2:
+        return []
+
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit + 1, i)))
+
+    return [n for n, is_prime in enumerate(sieve) if is_prime]
 
 primes = primes_comprehension(50)
 print(f"Primes up to 50: {primes}")
@@ -79,13 +87,17 @@ print(f"Flattened: {flattened}")
 deeply_nested = [[1, [2, 3]], [4, [5, [6, 7]]], 8]
 
 def flatten_deep(lst):
-    """Recursively flatten deeply nested lists"""
+    """Flatten deeply nested lists using an explicit stack of iterators"""
     result = []
-    for item in lst:
-        if isinstance(item, list):
-            result.extend(flatten_deep(item))
-        else:
+    stack = [iter(lst)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
             result.append(item)
+        else:
+            stack.pop()
     return result
 
 print(f"\nDeeply nested: {deeply_nested}")
@@ -112,12 +124,12 @@ students = [
     {'name': 'Diana', 'grade': 95, 'age': 19}
 ]
 
-by_grade = sorted(students, key=lambda x: x['grade'], reverse=True)
+by_grade = sorted(students, key=operator.itemgetter('grade'), reverse=True)
 print("Sorted by grade (descending):")
 for s in by_grade:
     print(f"  {s['name']}: {s['grade']}")
 
-by_age = sorted(students, key=lambda x: x['age'])
+by_age = sorted(students, key=operator.itemgetter('age'))
 print("\nSorted by age (ascending):")
 for s in by_age:
     print(f"  {s['name']}: {s['age']}")
@@ -198,13 +210,15 @@ sales_data = [
     {'product': 'E', 'quantity': 3, 'price': 45.00}
 ]
 
-totals = list(map(lambda x: x['quantity'] * x['price'], sales_data))
+enriched = [(x['product'], x['quantity'] * x['price']) for x in sales_data]
+
+totals = [total for _, total in enriched]
 print(f"Sale totals: {[f'${t:.2f}' for t in totals]}")
 
-high_value = list(filter(lambda x: x['quantity'] * x['price'] > 100, sales_data))
-print(f"High-value sales (>$100): {[x['product'] for x in high_value]}")
+high_value = [product for product, total in enriched if total > 100]
+print(f"High-value sales (>$100): {high_value}")
 
-total_revenue = reduce(lambda acc, x: acc + x['quantity'] * x['price'], sales_data, 0)
+total_revenue = sum(totals)
 print(f"Total revenue: ${total_revenue:.2f}")
 
 print("\nPRACTICE PROBLEM 2: Data Pipeline")
@@ -222,9 +236,7 @@ def create_pipeline(*functions):
 numbers = list(range(1, 11))
 
 pipeline = create_pipeline(
-    lambda x: map(lambda n: n ** 2, x),
-    lambda x: filter(lambda n: n > 20, x),
-    lambda x: map(lambda n: n / 2, x),
+    lambda x: (sq / 2 for n in x if (sq := n ** 2) > 20),
     list
 )
 
@@ -237,12 +249,11 @@ print("-" * 40)
 
 data = [23, 45, 67, 89, 12, 34, 56, 78, 90, 21]
 
-mean = reduce(lambda a, b: a + b, data) / len(data)
+mean = sum(data) / len(data)
 print(f"Data: {data}")
 print(f"Mean: {mean:.2f}")
 
-squared_diffs = list(map(lambda x: (x - mean) ** 2, data))
-variance = reduce(lambda a, b: a + b, squared_diffs) / len(data)
+variance = sum((x - mean) ** 2 for x in data) / len(data)
 std_dev = variance ** 0.5
 print(f"Variance: {variance:.2f}")
 print(f"Standard deviation: {std_dev:.2f}")
@@ -260,7 +271,7 @@ text = "The quick brown fox jumps over the lazy dog"
 words = text.split()
 print(f"Original: {text}")
 
-word_lengths = list(map(len, words))
+word_lengths = [len(w) for w in words]
 print(f"Word lengths: {word_lengths}")
 
 long_words = list(filter(lambda w: len(w) > 3, words))
@@ -272,9 +283,12 @@ print(f"Uppercase: {' '.join(uppercase)}")
 reversed_words = list(map(lambda w: w[::-1], words))
 print(f"Reversed words: {' '.join(reversed_words)}")
 
-total_chars = reduce(operator.add, map(len, words))
+total_chars = sum(word_lengths)
 print(f"Total characters (no spaces): {total_chars}")
 
+longest_word = reduce(lambda a, b: a if len(a) >= len(b) else b, words)
+print(f"Longest word: {longest_word}")
+
 print("\n" + "="*40)
 print("ADVANCED FUNCTIONAL PATTERNS")
 print("="*40)
@@ -295,15 +309,6 @@ def curry(func):
         return inner
     return curried
 
-def memoize(func):
-    """Cache function results"""
-    cache = {}
-    def wrapper(*args):
-        if args not in cache:
-            cache[args] = func(*args)
-        return cache[args]
-    return wrapper
-
 add_10 = compose(
     lambda x: x + 5,
     lambda x: x + 5
@@ -317,7 +322,7 @@ def multiply(x, y):
 times_5 = multiply(5)
 print(f"Curried multiply: times_5(3) = {times_5(3)}")
 
-@memoize
+@lru_cache(maxsize=None)
 def fibonacci(n):
     if n < 2:
         return n
@@ -5,8 +5,9 @@ Concepts: Generators, Decorators, Regular Expressions
 
 import time
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 import random
+from itertools import count, islice
 
 print("="*60)
 print("WEEK 8: ADVANCED FEATURES - TUTORIAL AND SOLUTIONS")
@@ -29,34 +30,32 @@ print("-" * 40)
 
 def infinite_counter(start=0, step=1):
     """Generate infinite sequence of numbers"""
-    current = start
-    while True:
-        yield current
-        current += step
+    return count(start, step)
 
 counter = infinite_counter(10, 2)
 print("First 10 values from infinite counter:")
-for _ in range(10):
-    print(f"  {next(counter)}", end=" ")
+for value in islice(counter, 10):
+    print(f"  {value}", end=" ")
 print()
 
 print("\nPRACTICE PROBLEM 2: Large File Reader")
 print("-" * 40)
 
-def read_large_file_simulator(num_lines=1000000):
+def read_large_file_simulator(num_lines=1000000, batch_size=1024):
     """Simulate reading a large file line by line"""
-    for i in range(num_lines):
-        yield f"Line {i+1}: Sample data {random.randint(1, 100)}"
+    values = range(1, 101)
+    for start in range(0, num_lines, batch_size):
+        samples = random.choices(values, k=min(batch_size, num_lines - start))
+        for line_no, sample in enumerate(samples, start + 1):
+            yield f"Line {line_no}: Sample data {sample}"
 
 def process_file_in_chunks(generator, chunk_size=100):
     """Process file in chunks to save memory"""
-    chunk = []
-    for line in generator:
-        chunk.append(line)
-        if len(chunk) >= chunk_size:
-            yield chunk
-            chunk = []
-    if chunk:
+    lines = iter(generator)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
         yield chunk
 
 file_gen = read_large_file_simulator(1000)
@@ -78,13 +77,19 @@ def fibonacci_generator():
         yield a
         a, b = b, a + b
 
+@lru_cache(maxsize=16)
+def _fibonacci_terms_up_to(limit):
+    """Build the tuple of Fibonacci numbers up to a limit once per limit"""
+    terms = []
+    a, b = 0, 1
+    while a <= limit:
+        terms.append(a)
+        a, b = b, a + b
+    return tuple(terms)
+
 def fibonacci_up_to(limit):
     """Generate Fibonacci numbers up to a limit"""
-    fib = fibonacci_generator()
-    for num in fib:
-        if num > limit:
-            break
-        yield num
+    return iter(_fibonacci_terms_up_to(limit))
 
 print("Fibonacci numbers up to 100:")
 for num in fibonacci_up_to(100):
@@ -94,26 +99,41 @@ print()
 print("\nPRACTICE PROBLEM 4: Prime Number Generator")
 print("-" * 40)
 
-def prime_generator():
-    """Generate prime numbers infinitely"""
+def segmented_sieve(segment_size=1 << 15):
+    """Generate primes infinitely with a segmented, odd-only sieve"""
     yield 2
-    primes = [2]
-    candidate = 3
+    odd_primes = []
+    low = 3
 
     while True:
-        is_prime = True
-        for prime in primes:
-            if prime * prime > candidate:
-                break
-            if candidate % prime == 0:
-                is_prime = False
-                break
+        # Index j of the segment stands for the odd number low + 2*j
+        high = low + 2 * segment_size
+        sieve = bytearray(segment_size)
 
-        if is_prime:
-            primes.append(candidate)
-            yield candidate
+        for p in odd_primes:
+            if p * p >= high:
+                break
+            start = max(p * p, -(-low // p) * p)
+            if start % 2 == 0:
+                start += p
+            j = (start - low) // 2
+            sieve[j::p] = b'\x01' * len(range(j, segment_size, p))
+
+        j = sieve.find(0)
+        while j != -1:
+            prime = low + 2 * j
+            if prime * prime < high:
+                k = (prime * prime - low) // 2
+                sieve[k::prime] = b'\x01' * len(range(k, segment_size, prime))
+            odd_primes.append(prime)
+            yield prime
+            j = sieve.find(0, j + 1)
+
+        low = high
 
-        candidate += 2
+def prime_generator():
+    """Generate prime numbers infinitely"""
+    yield from segmented_sieve()
 
 def first_n_primes(n):
     """Get first n prime numbers"""
@@ -140,12 +160,14 @@ print("-" * 40)
 
 def timer(func):
     """Measure function execution time"""
+    perf_counter_ns = time.perf_counter_ns
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time.time()
-        print(f"  {func.__name__} took {end - start:.6f} seconds")
+        elapsed_ns = perf_counter_ns() - start
+        print(f"  {func.__name__} took {elapsed_ns / 1e9:.6f} seconds")
         return result
     return wrapper
 
@@ -154,7 +176,7 @@ def slow_function(n):
     """Simulate slow function"""
     total = 0
     for i in range(n):
-        total += i ** 2
+        total += i * i
     return total
 
 result = slow_function(100000)
@@ -168,9 +190,9 @@ def require_auth(role=None):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            user = kwargs.get('user', {})
+            user = kwargs.get('user')
 
-            if not user.get('authenticated'):
+            if not user or not user.get('authenticated'):
                 return "Error: Authentication required"
 
             if role and user.get('role') != role:
@@ -202,19 +224,24 @@ for user in users:
 print("\nPRACTICE PROBLEM 3: Caching Decorator")
 print("-" * 40)
 
+_MISS = object()
+
 def cache(func):
     """Cache function results"""
     cached_results = {}
+    _get = cached_results.get
+    _set = cached_results.__setitem__
 
     @wraps(func)
     def wrapper(*args):
-        if args in cached_results:
+        result = _get(args, _MISS)
+        if result is not _MISS:
             print(f"  Cache hit for {args}")
-            return cached_results[args]
+            return result
 
         print(f"  Computing for {args}")
         result = func(*args)
-        cached_results[args] = result
+        _set(args, result)
         return result
 
     wrapper.cache_clear = lambda: cached_results.clear()
@@ -223,12 +250,22 @@ def cache(func):
     return wrapper
 
 @cache
+def square(n):
+    """Cheap function to show the hand-rolled cache"""
+    return n * n
+
+print("Testing cache decorator:")
+print(f"First call: {square(4)}")
+print(f"Second call (cached): {square(4)}")
+print(square.cache_info())
+
+@lru_cache(maxsize=128)
 def expensive_computation(n):
     """Simulate expensive computation"""
     time.sleep(0.1)
     return n ** 3
 
-print("Testing cache decorator:")
+print("\nTesting functools.lru_cache:")
 print(f"First call: {expensive_computation(5)}")
 print(f"Second call (cached): {expensive_computation(5)}")
 print(f"New computation: {expensive_computation(7)}")
@@ -242,12 +279,10 @@ def log_calls(log_args=True, log_result=True):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            log_msg = f"Calling {func.__name__}"
-
             if log_args:
-                log_msg += f" with args={args}, kwargs={kwargs}"
-
-            print(f"  LOG: {log_msg}")
+                print(f"  LOG: Calling {func.__name__} with args={args}, kwargs={kwargs}")
+            else:
+                print(f"  LOG: Calling {func.__name__}")
 
             result = func(*args, **kwargs)
 
@@ -284,10 +319,11 @@ Regular expressions for pattern matching:
 print("\nPRACTICE PROBLEM 1: Validate Email Addresses")
 print("-" * 40)
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def validate_email(email):
     """Validate email using regex"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 emails = [
     "user@example.com",
@@ -307,16 +343,11 @@ for email in emails:
 print("\nPRACTICE PROBLEM 2: Extract Phone Numbers")
 print("-" * 40)
 
+_PHONE_RE = re.compile(r'(?:\(\d{3}\)\s*|\b\d{3}[-.\s]?)\d{3}[-.\s]?\d{4}\b')
+
 def extract_phone_numbers(text):
     """Extract various phone number formats"""
-    patterns = [
-        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-        r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',
-        r'\b\d{3}\s\d{3}\s\d{4}\b'
-    ]
-
-    combined_pattern = '|'.join(patterns)
-    return re.findall(combined_pattern, text)
+    return _PHONE_RE.findall(text)
 
 text = """
 Contact us at 555-123-4567 or (555) 987-6543.
@@ -330,28 +361,49 @@ print(f"Found phone numbers: {phone_numbers}")
 print("\nPRACTICE PROBLEM 3: Simple Markdown Parser")
 print("-" * 40)
 
+# Bounded character classes instead of lazy .+? keep unbalanced markers
+# from sending the engine back over the rest of the line
+_MD_INLINE = (
+    r'\*\*\*(?P<strongem>[^*\n]+)\*\*\*'
+    r'|\*\*(?P<strong>(?:[^*\n]|\*[^*\n]+\*(?!\*[^*]))+)\*\*'
+    r'|\*(?P<em>(?:[^*\n]|\*\*[^*\n]+\*\*)+)\*'
+    r'|\[(?P<text>[^\]]+)\]\((?P<href>[^)]+)\)'
+    r'|`(?P<code>[^`]+)`'
+)
+_MD_INLINE_RE = re.compile(_MD_INLINE)
+_MD_TOKEN_RE = re.compile(r'^(?P<hashes>#{1,2}) (?P<heading>[^\n]+)$|' + _MD_INLINE, re.MULTILINE)
+
+def _md_inline(match):
+    """Convert one inline markdown token to HTML"""
+    if match.group('strongem') is not None:
+        return f"<strong><em>{_MD_INLINE_RE.sub(_md_inline, match.group('strongem'))}</em></strong>"
+    if match.group('strong') is not None:
+        return f"<strong>{_MD_INLINE_RE.sub(_md_inline, match.group('strong'))}</strong>"
+    if match.group('em') is not None:
+        return f"<em>{_MD_INLINE_RE.sub(_md_inline, match.group('em'))}</em>"
+    if match.group('text') is not None:
+        text = _MD_INLINE_RE.sub(_md_inline, match.group('text'))
+        return f'<a href="{match.group("href")}">{text}</a>'
+    return f"<code>{match.group('code')}</code>"
+
+def _md_token(match):
+    """Convert a heading line or inline markdown token to HTML"""
+    if match.group('heading') is not None:
+        tag = f"h{len(match.group('hashes'))}"
+        return f"<{tag}>{_MD_INLINE_RE.sub(_md_inline, match.group('heading'))}</{tag}>"
+    return _md_inline(match)
+
 class MarkdownParser:
     """Parse basic markdown syntax"""
 
     @staticmethod
     def parse(text):
-        """Parse markdown to HTML"""
-        text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
-
-        text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-
-        text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
-
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-
-        return text
+        """Parse markdown to HTML in a single scan"""
+        return _MD_TOKEN_RE.sub(_md_token, text)
 
 markdown = """# Main Title
 This is **bold text** and this is *italic text*.
+This is *italic with **bold** inside*.
 Here's a [link](https://example.com) and some `inline code`.
 ## Subtitle
 More content here."""
@@ -365,25 +417,33 @@ print(html)
 print("\nPRACTICE PROBLEM 4: Log File Analyzer")
 print("-" * 40)
 
-def analyze_log_file(log_text):
-    """Extract information from log entries"""
-    ip_pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
-    ips = re.findall(ip_pattern, log_text)
-
-    date_pattern = r'\d{4}-\d{2}-\d{2}'
-    dates = re.findall(date_pattern, log_text)
-
-    error_pattern = r'ERROR:?\s*(.+?)(?:\n|$)'
-    errors = re.findall(error_pattern, log_text, re.IGNORECASE)
+_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d{2}|[1-9]?\d)'
+_LOG_RE = re.compile(
+    rf'(?P<ip>\b(?:{_OCTET}\.){{3}}{_OCTET}\b)'
+    r'|(?P<date>\d{4}-\d{2}-\d{2})'
+    r'|(?i:ERROR):?\s*(?=(?P<error>[^\n]+))'
+    r'|(?:GET|POST)\s+(?=(?P<url>[^\s]+))'
+)
 
-    url_pattern = r'(?:GET|POST)\s+([^\s]+)'
-    urls = re.findall(url_pattern, log_text)
+def analyze_log_file(log_text):
+    """Extract information from log entries in a single scan"""
+    found = {'ip': [], 'date': [], 'error': [], 'url': []}
+    # Errors and URLs are captured by lookaheads so IPs and dates inside
+    # them are still scanned; skip nested repeats of the same kind
+    ends = {'error': 0, 'url': 0}
+    for match in _LOG_RE.finditer(log_text):
+        kind = match.lastgroup
+        if kind in ends:
+            if match.start() < ends[kind]:
+                continue
+            ends[kind] = match.end(kind)
+        found[kind].append(match.group(kind))
 
     return {
-        'ip_addresses': list(set(ips)),
-        'dates': list(set(dates)),
-        'errors': errors,
-        'urls': urls
+        'ip_addresses': list(dict.fromkeys(found['ip'])),
+        'dates': list(dict.fromkeys(found['date'])),
+        'errors': found['error'],
+        'urls': found['url']
     }
 
 log_sample = """
@@ -431,14 +491,24 @@ print("\nClass decorators:")
 
 def add_repr(cls):
     """Add __repr__ method to class"""
+    slots = getattr(cls, '__slots__', None)
+    if isinstance(slots, str):
+        slots = (slots,)
+
     def __repr__(self):
-        attrs = ', '.join(f'{k}={v}' for k, v in self.__dict__.items())
+        if slots is None:
+            items = self.__dict__.items()
+        else:
+            items = ((k, getattr(self, k)) for k in slots)
+        attrs = ', '.join(f'{k}={v}' for k, v in items)
         return f"{cls.__name__}({attrs})"
     cls.__repr__ = __repr__
     return cls
 
 @add_repr
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -449,6 +519,8 @@ print(f"Point with auto-generated repr: {p}")
 print("\nProperty decorators:")
 
 class Temperature:
+    __slots__ = ('_celsius',)
+
     def __init__(self, celsius=0):
         self._celsius = celsius
 
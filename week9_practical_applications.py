@@ -5,9 +5,15 @@ Concepts: Multiple function arguments, Serialization, CSV parsing, Advanced topi
 
 import json
 import csv
+import array
+import copy
+import os
 import pickle
-from functools import partial
+import sys
+import time
+from functools import lru_cache, partial
 import inspect
+from pathlib import Path
 from typing import Any, Dict, List
 
 print("="*60)
@@ -29,6 +35,11 @@ Advanced function signatures:
 print("\nPRACTICE PROBLEM 1: Flexible Configuration System")
 print("-" * 40)
 
+@lru_cache(maxsize=1024)
+def _sig(fn):
+    """Cached inspect.signature"""
+    return inspect.signature(fn)
+
 class ConfigSystem:
     """Flexible configuration management"""
 
@@ -43,14 +54,35 @@ class ConfigSystem:
 
         self.config.update(overrides)
 
+    def update_many(self, *dicts, **overrides):
+        """Update configuration from dicts only"""
+        for d in dicts:
+            self.config.update(d)
+
+        if overrides:
+            self.config.update(overrides)
+
     def get(self, key, default=None):
         """Get configuration value"""
         return self.config.get(key, default)
 
     def configure_function(self, func):
         """Create configured version of function"""
+        params = _sig(func).parameters
+        if any(p.kind is p.VAR_KEYWORD for p in params.values()):
+            accepted = None
+        else:
+            accepted = frozenset(name for name, p in params.items()
+                                 if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY))
+
         def wrapper(*args, **kwargs):
-            merged_kwargs = {**self.config, **kwargs}
+            if accepted is None:
+                if not kwargs:
+                    return func(*args, **self.config)
+                merged_kwargs = self.config.copy()
+            else:
+                merged_kwargs = {k: v for k, v in self.config.items() if k in accepted}
+            merged_kwargs.update(kwargs)
             return func(*args, **merged_kwargs)
         return wrapper
 
@@ -59,7 +91,7 @@ config = ConfigSystem(debug=False, timeout=30, retries=3)
 file_config = {'debug': True, 'log_level': 'INFO'}
 cli_config = {'timeout': 60}
 
-config.update(file_config, cli_config, retries=5)
+config.update_many(file_config, cli_config, retries=5)
 
 print(f"Final configuration: {config.config}")
 
@@ -117,47 +149,47 @@ class CommandParser:
     """Simple command-line argument parser"""
 
     def __init__(self):
-        self.commands = {}
+        self._funcs = {}
+        self._options = {}
 
     def command(self, *names, **options):
         """Decorator to register commands"""
         def decorator(func):
             for name in names:
-                self.commands[name] = {
-                    'func': func,
-                    'options': options
-                }
+                self._funcs[name] = func
+                self._options[name] = options
             return func
         return decorator
 
     def parse_and_execute(self, command_string):
         """Parse and execute command"""
-        parts = command_string.split()
-        if not parts:
+        tokens = iter(command_string.split())
+        cmd = next(tokens, None)
+        if cmd is None:
             return "No command provided"
 
-        cmd = parts[0]
         args = []
         kwargs = {}
 
-        i = 1
-        while i < len(parts):
-            if parts[i].startswith('--'):
-                key = parts[i][2:]
-                if i + 1 < len(parts) and not parts[i + 1].startswith('--'):
-                    kwargs[key] = parts[i + 1]
-                    i += 2
-                else:
-                    kwargs[key] = True
-                    i += 1
+        pending_key = None
+        for token in tokens:
+            if token.startswith('--'):
+                if pending_key is not None:
+                    kwargs[pending_key] = True
+                pending_key = token[2:]
+            elif pending_key is not None:
+                kwargs[pending_key] = token
+                pending_key = None
             else:
-                args.append(parts[i])
-                i += 1
+                args.append(token)
 
-        if cmd in self.commands:
-            return self.commands[cmd]['func'](*args, **kwargs)
-        else:
+        if pending_key is not None:
+            kwargs[pending_key] = True
+
+        func = self._funcs.get(cmd)
+        if func is None:
             return f"Unknown command: {cmd}"
+        return func(*args, **kwargs)
 
 parser = CommandParser()
 
@@ -201,13 +233,16 @@ class APIWrapper:
 
     def __getattr__(self, name):
         """Dynamically create API methods"""
+        base_endpoint = f"{self.base_url}/{name}"
+
         def method(*path_params, **kwargs):
-            endpoint = f"{self.base_url}/{name}"
+            endpoint = base_endpoint
 
             if path_params:
-                endpoint += "/" + "/".join(str(p) for p in path_params)
+                endpoint += "/" + "/".join(map(str, path_params))
 
-            headers = {**self.default_headers, **kwargs.get('headers', {})}
+            headers = self.default_headers.copy()
+            headers.update(kwargs.get('headers', {}))
 
             params = kwargs.get('params', {})
             data = kwargs.get('data', None)
@@ -218,6 +253,7 @@ class APIWrapper:
                 'params': params,
                 'data': data
             }
+        self.__dict__[name] = method
         return method
 
 api = APIWrapper("https://api.example.com", authorization="Bearer token")
@@ -241,12 +277,30 @@ Data persistence and serialization:
 print("\nPRACTICE PROBLEM 1: Settings Manager")
 print("-" * 40)
 
+@lru_cache(maxsize=256)
+def _split(path):
+    """Split a dotted settings path into its keys"""
+    return tuple(path.split('.'))
+
+_MISSING = object()
+
+def _flatten(prefix, obj):
+    """Yield (dotted path, value) for every non-dict leaf in nested dicts"""
+    for k, v in obj.items():
+        path = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            yield from _flatten(path, v)
+        else:
+            yield path, v
+
 class SettingsManager:
     """Manage application settings with persistence"""
 
     def __init__(self, filename="settings.json"):
         self.filename = filename
         self.settings = self.load()
+        self._index = dict(_flatten('', self.settings))
+        self._dirty = False
 
     def load(self):
         """Load settings from file"""
@@ -258,43 +312,78 @@ class SettingsManager:
 
     def save(self):
         """Save settings to file"""
-        with open(self.filename, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.settings, f)
+        os.replace(tmp, self.filename)
+        self._dirty = False
 
-    def get(self, key, default=None):
-        """Get setting value"""
-        keys = key.split('.')
-        value = self.settings
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+    def _save_if_dirty(self):
+        """Save settings only if a set changed them"""
+        if self._dirty:
+            self.save()
 
+    def get(self, key, default=None):
+        """Get setting value; dict subtrees are live and must be changed through set()"""
+        value = self._index.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.settings
+            for k in _split(key):
+                if isinstance(value, dict):
+                    value = value.get(k)
+                else:
+                    return default
         return value if value is not None else default
 
-    def set(self, key, value):
-        """Set setting value"""
-        keys = key.split('.')
+    def _set_no_save(self, key, value):
+        """Set setting value in memory only"""
+        *parents, last = _split(key)
         target = self.settings
 
-        for k in keys[:-1]:
+        for k in parents:
             if k not in target:
                 target[k] = {}
             target = target[k]
 
-        target[keys[-1]] = value
-        self.save()
+        # Mutable values may be the stored object itself, already changed
+        # in place, so they always count as a change; the type test keeps
+        # 1, 1.0 and True apart since they compare equal
+        if (isinstance(value, (dict, list)) or last not in target
+                or type(target[last]) is not type(value) or target[last] != value):
+            if isinstance(target.get(last), dict):
+                prefix = key + '.'
+                for path in [p for p in self._index if p.startswith(prefix)]:
+                    del self._index[path]
+            if isinstance(value, dict):
+                value = copy.deepcopy(value)
+                self._index.pop(key, None)
+                self._index.update(_flatten(key, value))
+            else:
+                self._index[key] = value
+            target[last] = value
+            self._dirty = True
+
+    def set(self, key, value):
+        """Set setting value"""
+        self._set_no_save(key, value)
+        self._save_if_dirty()
+
+    def set_many(self, updates):
+        """Set several values and save once"""
+        for key, value in updates.items():
+            self._set_no_save(key, value)
+        self._save_if_dirty()
 
     def __repr__(self):
         return f"SettingsManager({json.dumps(self.settings, indent=2)})"
 
 settings = SettingsManager("demo_settings.json")
-settings.set("app.name", "MyApp")
-settings.set("app.version", "1.0.0")
-settings.set("database.host", "localhost")
-settings.set("database.port", 5432)
+settings.set_many({
+    "app.name": "MyApp",
+    "app.version": "1.0.0",
+    "database.host": "localhost",
+    "database.port": 5432
+})
 
 print(f"App name: {settings.get('app.name')}")
 print(f"DB host: {settings.get('database.host')}")
@@ -303,6 +392,16 @@ print(f"All settings: {settings.settings}")
 print("\nPRACTICE PROBLEM 2: Game Save System")
 print("-" * 40)
 
+class Save:
+    """A single save slot record"""
+    __slots__ = ('data', 'timestamp', 'level', 'player_name')
+
+    def __init__(self, data, timestamp, level, player_name):
+        self.data = data
+        self.timestamp = timestamp
+        self.level = level
+        self.player_name = player_name
+
 class GameSaveSystem:
     """Save and load game state"""
 
@@ -311,15 +410,13 @@ class GameSaveSystem:
 
     def save_game(self, slot, game_state):
         """Save game state to slot"""
-        serialized = pickle.dumps(game_state)
-        self.saves[slot] = {
-            'data': serialized,
-            'timestamp': json.dumps({'saved': 'now'}),
-            'metadata': {
-                'level': game_state.get('level', 1),
-                'player_name': game_state.get('player_name', 'Unknown')
-            }
-        }
+        serialized = pickle.dumps(game_state, protocol=pickle.HIGHEST_PROTOCOL)
+        self.saves[slot] = Save(
+            serialized,
+            time.time(),
+            game_state.get('level', 1),
+            game_state.get('player_name', 'Unknown')
+        )
         print(f"Game saved to slot {slot}")
 
     def load_game(self, slot):
@@ -327,16 +424,14 @@ class GameSaveSystem:
         if slot not in self.saves:
             return None
 
-        save = self.saves[slot]
-        game_state = pickle.loads(save['data'])
+        game_state = pickle.loads(self.saves[slot].data)
         print(f"Game loaded from slot {slot}")
         return game_state
 
     def list_saves(self):
         """List all save slots"""
         for slot, save in self.saves.items():
-            meta = save['metadata']
-            print(f"  Slot {slot}: {meta['player_name']} - Level {meta['level']}")
+            print(f"  Slot {slot}: {save.player_name} - Level {save.level}")
 
 game_state = {
     'player_name': 'Hero',
@@ -362,6 +457,27 @@ print(f"Loaded game state: Level {loaded['level']}, Inventory: {loaded['inventor
 print("\nPRACTICE PROBLEM 3: Cache System")
 print("-" * 40)
 
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+def _json_safe(value, seen=None):
+    """Check that value round-trips through JSON unchanged"""
+    t = type(value)
+    if t in _JSON_SCALARS:
+        return True
+    if t is not list and t is not dict:
+        return False
+
+    # A container reached twice is shared or cyclic; JSON would copy it or loop
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return False
+    seen.add(id(value))
+
+    if t is list:
+        return all(_json_safe(v, seen) for v in value)
+    return all(type(k) is str and _json_safe(v, seen) for k, v in value.items())
+
 class CacheSystem:
     """Multi-backend cache system"""
 
@@ -369,10 +485,30 @@ class CacheSystem:
         self.backend = backend
         self.memory_cache = {}
         self.file_cache_dir = "cache"
+        self._dir = Path(self.file_cache_dir)
+        if backend == 'file':
+            self._dir.mkdir(exist_ok=True)
 
     def _get_file_path(self, key):
         """Get file path for key"""
-        return f"{self.file_cache_dir}/{key}.cache"
+        return self._dir / f"{key}.cache"
+
+    @staticmethod
+    def _encode(data):
+        """Encode a cache record, preferring JSON"""
+        try:
+            if _json_safe(data):
+                return b'J' + json.dumps(data, separators=(',', ':')).encode()
+        except RecursionError:
+            pass
+        return b'P' + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(blob):
+        """Decode a cache record written by _encode"""
+        if blob[:1] == b'J':
+            return json.loads(blob[1:])
+        return pickle.loads(blob[1:])
 
     def set(self, key, value, ttl=None):
         """Set cache value"""
@@ -383,9 +519,7 @@ class CacheSystem:
             }
         elif self.backend == 'file':
             data = {'value': value, 'ttl': ttl}
-            filename = self._get_file_path(key)
-            with open(filename, 'wb') as f:
-                pickle.dump(data, f)
+            self._get_file_path(key).write_bytes(self._encode(data))
 
         print(f"Cached: {key}")
 
@@ -396,15 +530,30 @@ class CacheSystem:
                 return self.memory_cache[key]['value']
         elif self.backend == 'file':
             try:
-                filename = self._get_file_path(key)
-                with open(filename, 'rb') as f:
-                    data = pickle.load(f)
-                return data['value']
-            except:
+                return self._decode(self._get_file_path(key).read_bytes())['value']
+            except Exception:
                 pass
 
         return default
 
+    def get_many(self, keys, default=None):
+        """Get several cache values as a dict"""
+        if self.backend == 'memory':
+            results = {}
+            for key in keys:
+                entry = self.memory_cache.get(key)
+                results[key] = default if entry is None else entry['value']
+            return results
+
+        paths = [(key, self._get_file_path(key)) for key in keys]
+        results = {}
+        for key, path in paths:
+            try:
+                results[key] = self._decode(path.read_bytes())['value']
+            except Exception:
+                results[key] = default
+        return results
+
     def invalidate(self, key):
         """Invalidate cache entry"""
         if self.backend == 'memory':
@@ -430,6 +579,9 @@ class GradeBookAnalyzer:
 
     def __init__(self):
         self.students = []
+        self.subjects = []
+        self._cols = {}
+        self._averages = array.array('d')
 
     def create_sample_csv(self, filename="grades.csv"):
         """Create sample gradebook CSV"""
@@ -441,7 +593,7 @@ class GradeBookAnalyzer:
             ["Diana", "82", "95", "90", "92"]
         ]
 
-        with open(filename, 'w', newline='') as f:
+        with open(filename, 'w', newline='', buffering=1024 * 1024) as f:
             writer = csv.writer(f)
             writer.writerow(headers)
             writer.writerows(data)
@@ -450,20 +602,32 @@ class GradeBookAnalyzer:
 
     def load_grades(self, filename):
         """Load grades from CSV"""
-        with open(filename, 'r') as f:
-            reader = csv.DictReader(f)
-            self.students = list(reader)
-
-        for student in self.students:
-            for key in student:
-                if key != "Student":
-                    student[key] = float(student[key])
+        with open(filename, 'r', newline='', buffering=1024 * 1024) as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            rows = []
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != len(headers):
+                    raise ValueError(f"Line {reader.line_num}: expected {len(headers)} fields, got {len(row)}")
+                rows.append((row[0], tuple(map(float, row[1:]))))
+
+        self.subjects = headers[1:]
+        self._cols = {
+            subject: array.array('d', column)
+            for subject, column in zip(self.subjects, zip(*(grades for _, grades in rows)))
+        }
+        if self.subjects:
+            self._averages = array.array('d', [sum(grades) / len(grades) for _, grades in rows])
+        else:
+            self._averages = array.array('d')
+        self.students = [{headers[0]: name} for name, _ in rows]
 
     def calculate_averages(self):
         """Calculate student averages"""
-        for student in self.students:
-            grades = [v for k, v in student.items() if k != "Student"]
-            student['Average'] = sum(grades) / len(grades)
+        for student, average in zip(self.students, self._averages):
+            student['Average'] = average
 
     def get_top_students(self, n=3):
         """Get top n students by average"""
@@ -473,11 +637,9 @@ class GradeBookAnalyzer:
 
     def subject_statistics(self):
         """Calculate statistics per subject"""
-        subjects = [k for k in self.students[0].keys() if k != "Student"]
         stats = {}
 
-        for subject in subjects:
-            grades = [s[subject] for s in self.students]
+        for subject, grades in self._cols.items():
             stats[subject] = {
                 'mean': sum(grades) / len(grades),
                 'min': min(grades),
@@ -507,43 +669,46 @@ class SalesReportGenerator:
 
     def process_sales_data(self, data):
         """Process sales data"""
-        summary = {}
+        totals = {}
 
         for row in data:
-            product = row['product']
             quantity = int(row['quantity'])
-            price = float(row['price'])
-            revenue = quantity * price
-
-            if product not in summary:
-                summary[product] = {
-                    'total_quantity': 0,
-                    'total_revenue': 0,
-                    'transactions': 0
-                }
-
-            summary[product]['total_quantity'] += quantity
-            summary[product]['total_revenue'] += revenue
-            summary[product]['transactions'] += 1
-
-        return summary
+            acc = totals.get(row['product'])
+            if acc is None:
+                acc = totals[row['product']] = [0, 0, 0]
+            acc[0] += quantity
+            acc[1] += quantity * float(row['price'])
+            acc[2] += 1
+
+        return {
+            product: {
+                'total_quantity': quantity,
+                'total_revenue': revenue,
+                'transactions': count
+            }
+            for product, (quantity, revenue, count) in totals.items()
+        }
 
     def generate_report(self, summary):
         """Generate formatted report"""
-        print("\nSales Report")
-        print("=" * 60)
-        print(f"{'Product':<15} {'Quantity':<10} {'Revenue':<12} {'Avg Sale':<10}")
-        print("-" * 60)
+        lines = [
+            "\nSales Report",
+            "=" * 60,
+            f"{'Product':<15} {'Quantity':<10} {'Revenue':<12} {'Avg Sale':<10}",
+            "-" * 60
+        ]
 
         total_revenue = 0
         for product, data in sorted(summary.items()):
-            avg_sale = data['total_revenue'] / data['transactions']
-            print(f"{product:<15} {data['total_quantity']:<10} "
-                  f"${data['total_revenue']:<11.2f} ${avg_sale:<9.2f}")
-            total_revenue += data['total_revenue']
+            revenue = data['total_revenue']
+            avg_sale = revenue / data['transactions']
+            lines.append(f"{product:<15} {data['total_quantity']:<10} "
+                         f"${revenue:<11.2f} ${avg_sale:<9.2f}")
+            total_revenue += revenue
 
-        print("-" * 60)
-        print(f"{'TOTAL':<15} {'':<10} ${total_revenue:<11.2f}")
+        lines.append("-" * 60)
+        lines.append(f"{'TOTAL':<15} {'':<10} ${total_revenue:<11.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 sales_data = [
     {'product': 'Widget A', 'quantity': '10', 'price': '15.99'},
@@ -597,7 +762,7 @@ def sample_function(a: int, b: str = "default") -> str:
 
 print(f"Function name: {sample_function.__name__}")
 print(f"Docstring: {sample_function.__doc__}")
-print(f"Signature: {inspect.signature(sample_function)}")
+print(f"Signature: {_sig(sample_function)}")
 print(f"Annotations: {sample_function.__annotations__}")
 
 print("\nPlugin System:")
@@ -608,11 +773,18 @@ class PluginSystem:
 
     def __init__(self):
         self.plugins = {}
+        self._instances = {}
+        self._transient = set()
 
-    def register(self, name):
+    def register(self, name, singleton=True):
         """Decorator to register plugins"""
         def decorator(plugin_class):
             self.plugins[name] = plugin_class
+            self._instances.pop(name, None)
+            if singleton:
+                self._transient.discard(name)
+            else:
+                self._transient.add(name)
             return plugin_class
         return decorator
 
@@ -620,6 +792,18 @@ class PluginSystem:
         """Get plugin by name"""
         return self.plugins.get(name)
 
+    def get_instance(self, name):
+        """Get plugin instance, reusing singletons"""
+        inst = self._instances.get(name)
+        if inst is None:
+            cls = self.plugins.get(name)
+            if cls is None:
+                return None
+            inst = cls()
+            if name not in self._transient:
+                self._instances[name] = inst
+        return inst
+
     def list_plugins(self):
         """List all plugins"""
         return list(self.plugins.keys())
@@ -639,10 +823,9 @@ class ValidatorPlugin:
 print(f"Available plugins: {plugins.list_plugins()}")
 
 for name in plugins.list_plugins():
-    plugin = plugins.get_plugin(name)()
+    plugin = plugins.get_instance(name)
     print(f"  {name}: {plugin.execute()}")
 
-import os
 if os.path.exists("demo_settings.json"):
     os.remove("demo_settings.json")
 if os.path.exists("grades.csv"):